@@ -1,14 +1,18 @@
 """Clanker - An LLM app environment with shared storage."""
 
-from .agent import ClankerAgent
-from .models import ModelTier, create_agent, list_available_providers
-from .runtime import (
-    RuntimeContext,
-    bootstrap_runtime_context,
-    get_runtime_context,
-    set_runtime_context,
-)
-from .tools import create_clanker_toolset, discover_cli_exports, list_available_exports
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import ClankerAgent
+    from .models import ModelTier, create_agent, list_available_providers
+    from .runtime import (
+        RuntimeContext,
+        bootstrap_runtime_context,
+        get_runtime_context,
+        set_runtime_context,
+    )
+    from .tools import create_clanker_toolset, discover_cli_exports, list_available_exports
 
 __version__ = "0.1.0"
 
@@ -31,4 +35,34 @@ __all__ = [
     "create_clanker_toolset",
     "discover_cli_exports",
     "list_available_exports",
-]
\ No newline at end of file
+]
+
+# Public name -> defining submodule. Resolved on first access so that
+# importing any clanker submodule (e.g. the CLI) doesn't pull in
+# pydantic-ai and every provider SDK up front.
+_LAZY_EXPORTS = {
+    "ClankerAgent": ".agent",
+    "ModelTier": ".models",
+    "create_agent": ".models",
+    "list_available_providers": ".models",
+    "RuntimeContext": ".runtime",
+    "bootstrap_runtime_context": ".runtime",
+    "get_runtime_context": ".runtime",
+    "set_runtime_context": ".runtime",
+    "create_clanker_toolset": ".tools",
+    "discover_cli_exports": ".tools",
+    "list_available_exports": ".tools",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
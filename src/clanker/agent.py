@@ -1,8 +1,19 @@
 """Clanker agent with natural language processing capabilities."""
 
-from typing import List, Dict, Any, Optional
+from itertools import chain
+from typing import List, Dict, Any, Optional, AsyncIterator
 from pydantic_ai import Agent
-from pydantic_ai.messages import ModelMessagesTypeAdapter
+from pydantic_ai.messages import (
+    BaseToolCallPart,
+    FunctionToolCallEvent,
+    FunctionToolResultEvent,
+    ModelMessagesTypeAdapter,
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+    ToolReturnPart,
+)
 
 from .models import create_agent as create_pydantic_agent, ModelTier
 from .runtime import RuntimeContext, get_runtime_context
@@ -127,6 +138,74 @@ class ClankerAgent:
                 'tool_output': ""
             }
 
+    async def handle_request_stream_async(
+        self, request: str
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Handle a natural language request, yielding the response as it streams.
+
+        Every model turn is streamed, so text the model writes before calling
+        tools is yielded as well as the answer it gives once they return.
+        Yields ``(kind, payload)`` pairs in the order they happen:
+
+        - ``("text", delta)``: a chunk of response text
+        - ``("tool_call", {'name', 'args'})``: a tool call, before it runs
+        - ``("tool_output", text)``: what a tool returned
+
+        Args:
+            request: The user's natural language request
+        """
+        logger.info(f"Processing streamed request: '{request}'")
+
+        try:
+            logger.debug("Calling agent.iter() with message history")
+            has_text = False
+            async with self.agent.iter(request, message_history=self.message_history) as run:
+                async for node in run:
+                    if Agent.is_model_request_node(node):
+                        async with node.stream(run.ctx) as response_stream:
+                            async for event in response_stream:
+                                delta = self._text_delta(event)
+                                if delta:
+                                    has_text = True
+                                    yield "text", delta
+                    elif Agent.is_call_tools_node(node):
+                        async with node.stream(run.ctx) as tool_stream:
+                            async for event in tool_stream:
+                                if isinstance(event, FunctionToolCallEvent):
+                                    yield "tool_call", {'name': event.part.tool_name, 'args': event.part.args}
+                                elif isinstance(event, FunctionToolResultEvent) and isinstance(event.part, ToolReturnPart):
+                                    yield "tool_output", event.part.model_response_str()
+
+            if not has_text:
+                yield "text", "I processed your request but have no text response."
+
+            # Update message history for future conversations
+            self.message_history = run.result.new_messages()
+            logger.info("Streamed request completed successfully")
+
+        except Exception as e:
+            logger.error(f"Streamed agent request failed: {str(e)}", exc_info=True)
+            yield "text", f"I encountered an error: {str(e)}"
+
+    @staticmethod
+    def _text_delta(event) -> str:
+        """Return the response text carried by a model stream event, if any."""
+        if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
+            return event.part.content
+        if isinstance(event, PartDeltaEvent) and isinstance(event.delta, TextPartDelta):
+            return event.delta.content_delta
+        return ""
+
+    @staticmethod
+    def _extract_tool_calls(messages) -> List[Dict[str, Any]]:
+        """Collect tool calls from agent messages for console display."""
+        parts = chain.from_iterable(getattr(msg, 'parts', ()) for msg in messages)
+        return [
+            {'name': part.tool_name, 'args': part.args}
+            for part in parts
+            if isinstance(part, BaseToolCallPart)
+        ]
+
     def _process_result(self, result) -> dict:
         """Process agent result into standard response format.
         
@@ -140,19 +219,9 @@ class ClankerAgent:
         self.message_history = result.new_messages()
 
         # Extract tool call information for console display
-        tool_calls = []
+        tool_calls = self._extract_tool_calls(self.message_history)
         tool_output = ""
 
-        # Parse tool calls from the result messages
-        for msg in result.new_messages():
-            if hasattr(msg, 'parts'):
-                for part in msg.parts:
-                    if hasattr(part, 'tool_name') and hasattr(part, 'args'):
-                        tool_calls.append({
-                            'name': part.tool_name,
-                            'args': part.args
-                        })
-
         response_text = result.output if hasattr(result, 'output') else str(result)
         if not response_text:
             response_text = "I processed your request but have no text response."
@@ -22,13 +22,15 @@ def discover() -> Dict[str, dict]:
         return {}
     
     found = {}
-    for item in apps_dir.iterdir():
-        if not item.is_dir() or item.name.startswith(('_', '.')):
-            continue
-        
-        info = _inspect_app(item)
-        if info:
-            found[item.name] = info
+    # scandir's entries carry the file type, so skipping non-directories costs no stat
+    with os.scandir(apps_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith(('_', '.')) or not entry.is_dir():
+                continue
+
+            info = _inspect_app(Path(entry.path))
+            if info:
+                found[entry.name] = info
     
     return found
 
@@ -73,7 +75,7 @@ def _inspect_app(path: Path) -> Optional[dict]:
                 "command": ["uv", "run", script_name]
             }
             return info
-    except (FileNotFoundError, tomllib.TOMLKitError, KeyError):
+    except (FileNotFoundError, tomllib.TOMLDecodeError, KeyError):
         pass
     
     # Find entry file and try to extract typer commands
@@ -1,17 +1,17 @@
 """Clanker CLI with natural language support."""
 
-import asyncio
+from __future__ import annotations
+
 import typer
 from pathlib import Path
-from typing import Optional, List, Annotated
+from typing import TYPE_CHECKING, Annotated, NoReturn
 
-from . import apps as apps_module
-from .models import list_available_providers, list_available_models
-from .agent import ClankerAgent
-from .models import ModelTier
 from .logger import get_logger
 from .runtime import bootstrap_runtime_context
 
+if TYPE_CHECKING:
+    from .agent import ClankerAgent
+
 logger = get_logger("cli")
 
 # Constants
@@ -44,19 +44,28 @@ app.add_typer(system_group, name="system")
 CODING_TOOLS = {"claude", "cursor", "gemini", "codex"}
 
 # Simple module-level instances - lazy initialized
-_agent: Optional[ClankerAgent] = None
+_agent: ClankerAgent | None = None
 
 def get_agent() -> ClankerAgent:
     """Get or create the agent instance."""
     global _agent
     if _agent is None:
         logger.debug("Creating ClankerAgent instance")
+        from .agent import ClankerAgent
         runtime = bootstrap_runtime_context()
         _agent = ClankerAgent(runtime=runtime)
         logger.debug("ClankerAgent created successfully")
     return _agent
 
 
+def _fail(message: str, code: int = 1, exc: Exception | None = None) -> NoReturn:
+    """Report an error on stderr and exit the current command."""
+    if exc is not None:
+        logger.error(message, exc_info=exc)
+    typer.echo(message, err=True)
+    raise typer.Exit(code)
+
+
 def _bootstrap_startup() -> None:
     """Initialize required services and autostart enabled daemons."""
     try:
@@ -85,24 +94,35 @@ def main(ctx: typer.Context):
     _bootstrap_startup()
 
 
+def _run_console() -> None:
+    """Run the interactive console, on uvloop when it is installed."""
+    from .console import InteractiveConsole
+    console = InteractiveConsole()
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is the optional `uvloop` extra (unavailable on Windows)
+        import asyncio
+        asyncio.run(console.run())
+    else:
+        uvloop.run(console.run())
+
+
 @app.command(hidden=True)
 def _console():
     """Launch interactive console (internal command)."""
     try:
-        from .console import InteractiveConsole
-        console = InteractiveConsole()
-        asyncio.run(console.run())
+        _run_console()
     except KeyboardInterrupt:
         typer.echo("\nExiting...")
     except Exception as e:
-        typer.echo(f"Error launching console: {e}", err=True)
-        raise typer.Exit(1)
+        _fail(f"Error launching console: {e}")
 
 
 # Direct coding tool commands
 @app.command()
 def claude(
-    request: Annotated[Optional[List[str]], typer.Argument(help="Request to pass to Claude")] = None
+    request: Annotated[list[str] | None, typer.Argument(help="Request to pass to Claude")] = None
 ):
     """Launch Claude Code with context."""
     handle_coding_tool_command("claude", " ".join(request) if request else "")
@@ -110,7 +130,7 @@ def claude(
 
 @app.command()
 def cursor(
-    request: Annotated[Optional[List[str]], typer.Argument(help="Request to pass to Cursor")] = None
+    request: Annotated[list[str] | None, typer.Argument(help="Request to pass to Cursor")] = None
 ):
     """Launch Cursor-agent with context."""
     handle_coding_tool_command("cursor", " ".join(request) if request else "")
@@ -118,7 +138,7 @@ def cursor(
 
 @app.command()
 def gemini(
-    request: Annotated[Optional[List[str]], typer.Argument(help="Request to pass to Gemini")] = None
+    request: Annotated[list[str] | None, typer.Argument(help="Request to pass to Gemini")] = None
 ):
     """Launch Gemini CLI with context."""
     handle_coding_tool_command("gemini", " ".join(request) if request else "")
@@ -126,7 +146,7 @@ def gemini(
 
 @app.command()
 def codex(
-    request: Annotated[Optional[List[str]], typer.Argument(help="Request to pass to Codex")] = None
+    request: Annotated[list[str] | None, typer.Argument(help="Request to pass to Codex")] = None
 ):
     """Launch OpenAI Codex CLI with context."""
     handle_coding_tool_command("codex", " ".join(request) if request else "")
@@ -142,23 +162,24 @@ def handle_coding_tool_command(tool_name: str, request: str):
         if err:
             typer.echo(err, err=True)
     except Exception as e:
-        typer.echo(f"Launch failed: {e}", err=True)
-        raise typer.Exit(1)
+        _fail(f"Launch failed: {e}")
 
 
 # App management commands
 @app_group.command("list")
 def app_list():
     """List available apps."""
+    from . import apps as apps_module
     apps_module.list_apps()
 
 
 @app_group.command("run")
 def app_run(
     name: Annotated[str, typer.Argument(help="App name to run")],
-    args: Annotated[Optional[List[str]], typer.Argument(help="Arguments to pass to the app")] = None
+    args: Annotated[list[str] | None, typer.Argument(help="Arguments to pass to the app")] = None
 ):
     """Run an app."""
+    from . import apps as apps_module
     exit_code = apps_module.run(name, args or [])
     raise typer.Exit(exit_code)
 
@@ -168,6 +189,7 @@ def app_info(
     name: Annotated[str, typer.Argument(help="App name to show info for")]
 ):
     """Show app details."""
+    from . import apps as apps_module
     discovered = apps_module.discover()
     app_info = discovered.get(name)
     if app_info:
@@ -194,8 +216,7 @@ def app_scaffold(
     # Create app directory
     app_dir = Path(f"apps/{name}")
     if app_dir.exists():
-        typer.echo(f"App directory apps/{name} already exists!", err=True)
-        raise typer.Exit(1)
+        _fail(f"App directory apps/{name} already exists!")
 
     try:
         app_dir.mkdir(parents=True)
@@ -216,31 +237,36 @@ def app_scaffold(
         typer.echo(f"  Follow the instructions in INSTRUCTIONS.md")
 
     except Exception as e:
-        typer.echo(f"Error creating scaffold: {e}", err=True)
-        raise typer.Exit(1)
+        _fail(f"Error creating scaffold: {e}")
 
 
 # System management commands
 @system_group.command("models")
 def system_models():
     """Show available AI models."""
+    from .models import list_available_providers, list_available_models
+
     providers = list_available_providers()
     if not providers:
-        typer.echo("No API keys configured. Set these in .env:")
-        typer.echo("  OPENAI_API_KEY=...")
-        typer.echo("  ANTHROPIC_API_KEY=...")
-        typer.echo("  GOOGLE_API_KEY=...")
+        typer.echo(
+            "No API keys configured. Set these in .env:\n"
+            "  OPENAI_API_KEY=...\n"
+            "  ANTHROPIC_API_KEY=...\n"
+            "  GOOGLE_API_KEY=..."
+        )
         return
 
-    typer.echo(f"Configured providers: {', '.join(providers)}")
+    # Collect everything and echo once instead of once per line
+    lines = [f"Configured providers: {', '.join(providers)}"]
 
     available = list_available_models()
     if available:
-        typer.echo("\nAvailable models:")
+        lines.append("\nAvailable models:")
         for provider, models in available.items():
-            typer.echo(f"  {provider}:")
-            for model in models:
-                typer.echo(f"    - {model}")
+            lines.append(f"  {provider}:")
+            lines.extend(f"    - {model}" for model in models)
+
+    typer.echo("\n".join(lines))
 
 
 @system_group.command("profile")
@@ -258,8 +284,8 @@ def system_config():
 @system_group.command("launch")
 def system_launch(
     tool: Annotated[str, typer.Argument(help="Tool to launch (claude, cursor, gemini)")],
-    app_name: Annotated[Optional[str], typer.Option("--app", help="App context to use")] = None,
-    request: Annotated[Optional[str], typer.Option("--request", help="Request to pass to tool")] = None
+    app_name: Annotated[str | None, typer.Option("--app", help="App context to use")] = None,
+    request: Annotated[str | None, typer.Option("--request", help="Request to pass to tool")] = None
 ):
     """Launch coding tools with advanced options."""
     if tool not in CODING_TOOLS:
@@ -279,12 +305,10 @@ def system_launch(
     from .tools import launch_coding_tool_cli
     try:
         err = launch_coding_tool_cli(tool, query)
-        if err:
-            typer.echo(err, err=True)
-            raise typer.Exit(1)
     except Exception as e:
-        typer.echo(f"Launch failed: {e}", err=True)
-        raise typer.Exit(1)
+        _fail(f"Launch failed: {e}")
+    if err:
+        _fail(err)
 
 
 @system_group.command("build")
@@ -295,24 +319,21 @@ def system_build():
 
         # Build all contexts without query
         results = build_all_contexts()
+    except Exception as e:
+        _fail(f"❌ Rebuild failed: {e}", exc=e)
 
-        # Show results
-        successful = [name for name, success in results.items() if success]
-        failed = [name for name, success in results.items() if not success]
-
-        if successful:
-            typer.echo(f"✅ Successfully rebuilt: {', '.join(successful)}")
+    # Show results
+    successful = [name for name, success in results.items() if success]
+    failed = [name for name, success in results.items() if not success]
 
-        if failed:
-            typer.echo(f"❌ Failed to rebuild: {', '.join(failed)}", err=True)
-            raise typer.Exit(1)
+    if successful:
+        typer.echo(f"✅ Successfully rebuilt: {', '.join(successful)}")
 
-        if not successful and not failed:
-            typer.echo("⚠️ No instruction files to rebuild")
+    if failed:
+        _fail(f"❌ Failed to rebuild: {', '.join(failed)}")
 
-    except Exception as e:
-        typer.echo(f"❌ Rebuild failed: {e}", err=True)
-        raise typer.Exit(1)
+    if not successful and not failed:
+        typer.echo("⚠️ No instruction files to rebuild")
 
 
 @system_group.command("setup")
@@ -331,8 +352,7 @@ def system_setup():
     except KeyboardInterrupt:
         typer.echo("\nSetup interrupted")
     except Exception as e:
-        typer.echo(f"Setup failed: {e}", err=True)
-        raise typer.Exit(1)
+        _fail(f"Setup failed: {e}")
 
 
 @system_group.command("version")
@@ -359,9 +379,7 @@ def main():
             logger.warning(f"Onboarding check failed: {e}")
 
         try:
-            from .console import InteractiveConsole
-            console = InteractiveConsole()
-            asyncio.run(console.run())
+            _run_console()
         except KeyboardInterrupt:
             typer.echo("\nExiting...")
         except Exception as e:
@@ -1,41 +1,136 @@
 """Interactive console for Clanker with streaming and context awareness."""
 
-import asyncio
+import bisect
+import functools
+import os
 import sys
-from io import StringIO
-from typing import Dict, Any
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any
 from collections import deque
+from dataclasses import dataclass
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
 
-from .models import ModelTier
-from .agent import ClankerAgent
+from . import apps as apps_module
+from .models import ModelTier, list_available_providers, list_available_models
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    from .agent import ClankerAgent
+
 logger = get_logger("console")
 console = Console()
 
+# Streamed response text is buffered until this many characters (or a newline)
+STREAM_FLUSH_CHARS = 16
+
+# ANSI erase-in-line, then return to column 0 (clears the "Thinking..." indicator)
+_CLEAR_LINE = "\x1b[2K\r"
+
+# prompt_toolkit HTML for the input prompt, matching the Rich "You" prompt
+PROMPT_MESSAGE = "\n<b><ansiblue>You</ansiblue></b>: "
+
+_command_name = itemgetter(0)
+
+# Body of the /help panel (Rich markup)
+HELP_TEXT = """
+[bold]Clanker Interactive Console[/bold]
+
+[cyan]Slash Commands:[/cyan]
+  /help        - Show this help message
+  /context     - Show conversation history
+  /tools       - List available tools
+  /exit        - Exit the console
+  /list-apps   - List all available apps
+  /models      - Show available AI models
+  /example:*   - Example app commands (add, list, search, etc.)
+
+[cyan]Examples:[/cyan]
+  "What are my recipes?"
+  "/list-apps"
+  "/example:add 'Today was great!'"
+"""
+
+
+def _clear_line():
+    """Erase the current terminal line without a Rich render pass."""
+    out = console.file
+    out.write(_CLEAR_LINE)
+    out.flush()
+
+
+@functools.cache
+def _help_panel():
+    """Build the /help panel once, with its markup parsed up front."""
+    from rich.panel import Panel
+    return Panel(console.render_str(HELP_TEXT, highlight=False), border_style="blue")
+
+
+def _prefix_slice(sorted_commands, prefix):
+    """Return the run of sorted (command, description) pairs starting with `prefix`."""
+    lo = bisect.bisect_left(sorted_commands, prefix, key=_command_name)
+    hi = bisect.bisect_right(sorted_commands, prefix + "\uffff", lo, key=_command_name)
+    return sorted_commands[lo:hi]
+
+
+@dataclass(slots=True)
+class Exchange:
+    """One user/assistant turn kept in the console history."""
+    user: str
+    assistant: str
+    tools: list
+    tool_output: str | None
+    # This turn's sentence in the recent-context prompt prefix
+    context_summary: str
+    # Display previews for show_context, computed once when recorded
+    user_preview: str
+    assistant_preview: str
+    tool_previews: list[str]
+    tool_output_first_line: str | None
+
 
 class InteractiveConsole:
     """Interactive console with streaming responses and tool visibility."""
     
-    def __init__(self, model_tier: ModelTier = ModelTier.MEDIUM, context_window: int = 5):
+    def __init__(
+        self,
+        model_tier: ModelTier = ModelTier.MEDIUM,
+        context_window: int = 5,
+        stream: bool = True,
+    ):
         """Initialize the interactive console.
         
         Args:
             model_tier: The model tier to use for the agent
             context_window: Number of exchanges to keep in history
+            stream: Print tool calls, tool output and the response as the
+                model produces them. When False, wait for the full result.
         """
         self.model_tier = model_tier
+        self.stream = stream
         self.history = deque(maxlen=context_window)
-        self.agent = None
-        self.setup_agent()
-        
+        self._agent = None  # Created on first use; see the agent property
+        self._commands_cache = None
+        self._sorted_commands = ()  # (command, description) pairs, sorted by command
+        self._recent_context = ""  # Prompt prefix summarizing recent exchanges
+        self._prompt_session = None  # prompt_toolkit session, created on first input
+        self._tools_text = None  # Rendered tool listing, cached per agent
+        # Progress output (indicator, incremental flushes) only helps on a terminal
+        self._live_output = console.is_terminal
+
+    @property
+    def agent(self) -> "ClankerAgent":
+        """The clanker agent, set up on first use so the console starts fast."""
+        if self._agent is None:
+            self.setup_agent()
+        return self._agent
+
     def setup_agent(self):
         """Set up the clanker agent with tools."""
+        from .agent import ClankerAgent
+
         # Create ClankerAgent with the specified model tier
-        self.agent = ClankerAgent(self.model_tier)
+        self._agent = ClankerAgent(self.model_tier)
+        self._tools_text = None  # New agent, new toolsets
         logger.info("Interactive console agent initialized")
     
     async def handle_request(self, request: str) -> tuple[str, list]:
@@ -47,77 +142,58 @@ class InteractiveConsole:
         Returns:
             Tuple of (response_text, tool_calls)
         """
-        # Build context-aware prompt
-        context_prompt = request
-        
-        # Add conversation context if we have history
-        if self.history:
-            # Add recent conversation summary for context
-            recent_context = "\n[Previous context: "
-            for exchange in list(self.history)[-2:]:  # Last 2 exchanges
-                if exchange.get('tools'):
-                    tools_used = ', '.join(t['name'] for t in exchange['tools'])
-                    recent_context += f"User asked '{exchange['user'][:30]}...', you used tools: {tools_used}. "
-                else:
-                    recent_context += f"User asked '{exchange['user'][:30]}...'. "
-            recent_context += "]\n"
-            context_prompt = recent_context + context_prompt
-        
+        # Build context-aware prompt (prefix is maintained as history changes)
+        context_prompt = self._recent_context + request
+
         try:
             # Show pending indicator
-            console.print("\n[dim]Thinking...[/dim]", end="\r")
-
-            # Run the agent (now returns structured result)
-            result = await self.agent.handle_request_async(context_prompt)
-
-            # Clear the pending indicator
-            console.print(" " * 20, end="\r")  # Clear the line
-
-            # Get data from structured result
-            response_text = result['response']
-            tool_calls = result['tool_calls']
-            tool_output = result['tool_output']
+            if self._live_output:
+                console.print("\n[dim]Thinking...[/dim]", end="\r")
 
-            # Display tool calls and handle confirmations
-            for tool in tool_calls:
-                tool_name = tool['name']
-                if tool.get('args') and isinstance(tool['args'], dict) and tool['args']:
-                    args_str = ', '.join(f"{k}={v}" for k, v in tool['args'].items())
-                    console.print(f"[dim yellow]→ Calling: {tool_name}({args_str})[/dim yellow]")
-                else:
-                    console.print(f"[dim yellow]→ Calling: {tool_name}[/dim yellow]")
-
-                # Handle confirmation for launch_claude_code tool
-                # Note: Confirmation is skipped since the process will be replaced anyway
-                # The tool handles its own environment cleanup
-
-            # Show tool output if any
-            if tool_output and tool_output.strip():
-                console.print("[dim green]← Tool output:[/dim green]")
-                # Show first few lines of captured output
-                output_lines = tool_output.strip().split('\n')[:3]
-                for line in output_lines:
-                    if line.strip():
-                        console.print(f"[dim]   {line[:80]}{'...' if len(line) > 80 else ''}[/dim]")
-                if len(tool_output.strip().split('\n')) > 3:
-                    console.print("[dim]   ...[/dim]")
-
-            # Display response with streaming effect
-            if response_text and response_text.strip():
-                console.print("[bold cyan]Clanker[/bold cyan]: ", end="")
-                await self._stream_response(str(response_text))
+            if self.stream:
+                # Tool calls and the response are printed as they arrive
+                response_text, tool_calls, tool_output_stripped = await self._stream_request(context_prompt)
             else:
-                # No response to show
-                pass
-
-            # Update history
-            self.history.append({
-                "user": request,
-                "assistant": response_text,
-                "tools": tool_calls,
-                "tool_output": tool_output.strip() if tool_output else None
-            })
-
+                # Run the agent (now returns structured result)
+                result = await self.agent.handle_request_async(context_prompt)
+
+                # Clear the pending indicator
+                if self._live_output:
+                    _clear_line()
+
+                # Get data from structured result
+                response = result['response']
+                response_text = str(response) if response is not None else ""
+                tool_calls = result['tool_calls']
+                tool_output = result['tool_output']
+                tool_output_stripped = tool_output.strip() if tool_output else ""
+
+                # Collect tool calls and output preview, then print them in one go
+                display_lines = self._tool_call_lines(tool_calls)
+
+                # Show tool output if any
+                display_lines.extend(self._tool_output_lines(tool_output_stripped))
+
+                if display_lines:
+                    console.print("\n".join(display_lines))
+
+                if response_text.strip():
+                    console.print(f"[bold cyan]Clanker[/bold cyan]: {response_text}")
+
+            # Update history, with display previews for show_context prepared once
+            stored_output = tool_output_stripped or None
+            self.history.append(Exchange(
+                user=request,
+                assistant=response_text,
+                tools=tool_calls,
+                tool_output=stored_output,
+                context_summary=self._summarize_exchange(request, tool_calls),
+                user_preview=request[:60],
+                assistant_preview=response_text[:60] or "No response",
+                tool_previews=[self._format_tool_preview(tool) for tool in tool_calls],
+                tool_output_first_line=stored_output.split('\n', 1)[0][:50] if stored_output else None,
+            ))
+            self._recent_context = self._build_recent_context()
 
             return response_text, tool_calls
             
@@ -127,56 +203,164 @@ class InteractiveConsole:
             logger.error(f"Console request failed: {e}", exc_info=True)
             return error_msg, []
 
-    async def _stream_response(self, text: str, delay: float = 0.02):
-        """Simulate streaming response word by word.
+    def _build_recent_context(self) -> str:
+        """Summarize the last two exchanges as a prompt prefix."""
+        if not self.history:
+            return ""
+
+        # Last 2 exchanges, indexed directly rather than copying the deque
+        history = self.history
+        recent = (history[-2], history[-1]) if len(history) >= 2 else (history[-1],)
+
+        return "".join(("\n[Previous context: ", *(e.context_summary for e in recent), "]\n"))
+
+    @staticmethod
+    def _summarize_exchange(request: str, tool_calls: list) -> str:
+        """Format one exchange's sentence for the recent-context prefix."""
+        if tool_calls:
+            tools_used = ', '.join(t['name'] for t in tool_calls)
+            return f"User asked '{request[:30]}...', you used tools: {tools_used}. "
+        return f"User asked '{request[:30]}...'. "
+
+    async def _stream_request(self, context_prompt: str) -> tuple[str, list, str]:
+        """Run the agent and print its response as the model produces it.
+
+        Deltas are buffered and written once a newline arrives or
+        STREAM_FLUSH_CHARS characters have accumulated, so providers that send
+        a token per chunk don't cost a write and flush per token. Tool calls
+        and their output end the current line of text; text after them is a
+        new model turn and starts a new one.
 
         Args:
-            text: The text to stream
-            delay: Delay between words in seconds
+            context_prompt: The request with recent context prepended
+
+        Returns:
+            Tuple of (response_text, tool_calls, tool_output)
         """
-        words = text.split()
-        for i, word in enumerate(words):
-            console.print(word, end=" ")
-            if i % 10 == 9:  # Occasional longer pause
-                await asyncio.sleep(delay * 2)
+        out = console.file
+        tool_calls = []
+        tool_outputs = []
+        turns = []  # Response text of each model turn
+        pending = []
+        pending_len = 0
+        indicator = self._live_output  # "Thinking..." still on screen
+        in_text = False  # Inside a "Clanker: " line
+        async for kind, payload in self.agent.handle_request_stream_async(context_prompt):
+            if indicator:
+                _clear_line()
+                indicator = False
+            if kind != "text":
+                if in_text:
+                    pending.append("\n")
+                    out.write("".join(pending))
+                    out.flush()
+                    pending.clear()
+                    pending_len = 0
+                    in_text = False
+                if kind == "tool_call":
+                    tool_calls.append(payload)
+                    display_lines = self._tool_call_lines([payload])
+                else:
+                    output = payload.strip()
+                    tool_outputs.append(output)
+                    display_lines = self._tool_output_lines(output)
+                if display_lines:
+                    console.print("\n".join(display_lines))
+                continue
+            if not in_text:
+                console.print("[bold cyan]Clanker[/bold cyan]: ", end="")
+                turns.append([])
+                in_text = True
+            turns[-1].append(payload)
+            pending.append(payload)
+            pending_len += len(payload)
+            # Off a terminal nobody watches it arrive, so write it all at the end
+            if self._live_output and (pending_len >= STREAM_FLUSH_CHARS or "\n" in payload):
+                out.write("".join(pending))
+                out.flush()
+                pending.clear()
+                pending_len = 0
+
+        if in_text:
+            pending.append("\n")  # Final newline
+            out.write("".join(pending))
+            out.flush()
+        elif indicator:
+            _clear_line()  # Clear the pending indicator
+        response_text = "\n\n".join("".join(turn).strip() for turn in turns)
+        return response_text, tool_calls, "\n".join(filter(None, tool_outputs))
+
+    @staticmethod
+    def _tool_output_lines(tool_output: str) -> list[str]:
+        """Format a preview of the first few lines of tool output."""
+        output_lines = tool_output.splitlines()
+        if not output_lines:
+            return []
+        display_lines = ["[dim green]← Tool output:[/dim green]"]
+        # Show first few lines of captured output
+        for line in output_lines[:3]:
+            if line.strip():
+                display_lines.append(f"[dim]   {line[:80]}{'...' if len(line) > 80 else ''}[/dim]")
+        if len(output_lines) > 3:
+            display_lines.append("[dim]   ...[/dim]")
+        return display_lines
+
+    @staticmethod
+    def _tool_call_lines(tool_calls: list) -> list[str]:
+        """Format the "Calling" display line for each tool call."""
+        display_lines = []
+        for tool in tool_calls:
+            tool_name = tool['name']
+            if tool.get('args') and isinstance(tool['args'], dict) and tool['args']:
+                args_str = ', '.join(f"{k}={v}" for k, v in tool['args'].items())
+                display_lines.append(f"[dim yellow]→ Calling: {tool_name}({args_str})[/dim yellow]")
             else:
-                await asyncio.sleep(delay)
-        console.print()  # Final newline
-    
-    
+                display_lines.append(f"[dim yellow]→ Calling: {tool_name}[/dim yellow]")
+        return display_lines
+
     def show_context(self):
         """Display current conversation context."""
         if not self.history:
             console.print("[dim]No conversation history yet[/dim]")
             return
-            
-        console.print("\n[bold]Conversation Context[/bold]")
+
+        lines = ["\n[bold]Conversation Context[/bold]"]
         for i, exchange in enumerate(self.history, 1):
-            console.print(f"\n[dim]Exchange {i}:[/dim]")
-            console.print(f"  You: {exchange['user'][:60]}...")
+            lines.append(f"\n[dim]Exchange {i}:[/dim]")
+            lines.append(f"  You: {exchange.user_preview}...")
             
             # Show tools if used
-            if exchange.get('tools'):
-                for tool in exchange['tools']:
-                    tool_name = tool['name']
-                    if tool.get('args') and isinstance(tool['args'], dict) and tool['args']:
-                        args_preview = ', '.join(f"{k}={v}" for k, v in list(tool['args'].items())[:2])
-                        console.print(f"  [dim yellow]→ {tool_name}({args_preview})[/dim yellow]")
-                    else:
-                        console.print(f"  [dim yellow]→ {tool_name}[/dim yellow]")
+            if exchange.tool_previews:
+                for tool_preview in exchange.tool_previews:
+                    lines.append(f"  [dim yellow]→ {tool_preview}[/dim yellow]")
                 # Show tool output preview if available
-                if exchange.get('tool_output'):
-                    first_line = exchange['tool_output'].split('\n')[0][:50]
-                    console.print(f"  [dim green]← {first_line}...[/dim green]")
+                if exchange.tool_output_first_line:
+                    lines.append(f"  [dim green]← {exchange.tool_output_first_line}...[/dim green]")
             
             # Show response preview
-            response_preview = str(exchange['assistant'])[:60] if exchange['assistant'] else "No response"
-            console.print(f"  Clanker: {response_preview}...")
+            lines.append(f"  Clanker: {exchange.assistant_preview}...")
+
+        console.print("\n".join(lines))
         
     
+    @staticmethod
+    def _format_tool_preview(tool: Dict[str, Any]) -> str:
+        """Format a tool call as `name(k=v, ...)` showing at most two args."""
+        args = tool.get('args')
+        if args and isinstance(args, dict):
+            args_preview = ', '.join(f"{k}={v}" for k, v in list(args.items())[:2])
+            return f"{tool['name']}({args_preview})"
+        return tool['name']
+
     def show_available_tools(self):
         """Display available tools with parameter information."""
-        console.print("\n[bold]Available Tools[/bold]")
+        if self._tools_text is None:
+            self._tools_text = self._format_available_tools()
+        console.print(self._tools_text)
+
+    def _format_available_tools(self) -> str:
+        """Render the tool listing shown by show_available_tools."""
+        lines = ["\n[bold]Available Tools[/bold]"]
 
         tools = self.agent.get_available_tools()
         if tools:
@@ -198,22 +382,27 @@ class InteractiveConsole:
                     params_str = "()"
                 
                 # Display tool with signature
-                console.print(f"  • [cyan]{info['name']}{params_str}[/cyan]")
+                lines.append(f"  • [cyan]{info['name']}{params_str}[/cyan]")
                 
                 # Show description
                 if info.get('description'):
-                    console.print(f"    [dim]{info['description']}[/dim]")
+                    lines.append(f"    [dim]{info['description']}[/dim]")
                 
                 # Show parameter details if they have descriptions
                 if info.get('parameters'):
                     for param in info['parameters']:
                         if param.get('description'):
-                            console.print(f"    [dim yellow]  {param['name']}:[/dim yellow] [dim]{param['description']}[/dim]")
+                            lines.append(f"    [dim yellow]  {param['name']}:[/dim yellow] [dim]{param['description']}[/dim]")
         else:
-            console.print("[dim]No tools configured[/dim]")
+            lines.append("[dim]No tools configured[/dim]")
+
+        return "\n".join(lines)
     
     def _get_available_commands(self):
-        """Get all available slash commands."""
+        """Get all available slash commands (built once per session)."""
+        if self._commands_cache is not None:
+            return self._commands_cache
+
         commands = {}
 
         # Console commands
@@ -226,14 +415,14 @@ class InteractiveConsole:
 
         # App exports (simplified - just get command names)
         try:
-            from . import apps as apps_module
             discovered = apps_module.discover()
-            for app_name, app_info in discovered.items():
-                if app_info.get('exports'):
-                    for export_name in app_info['exports']:
-                        commands[f'/{export_name}'] = f'Run {app_name} {export_name} command'
-        except:
-            pass
+        except Exception as e:
+            logger.warning(f"App discovery for slash commands failed: {e}")
+            discovered = {}
+        for app_name, app_info in discovered.items():
+            if app_info.get('exports'):
+                for export_name in app_info['exports']:
+                    commands[f'/{export_name}'] = f'Run {app_name} {export_name} command'
 
         # Core CLI commands (basic ones)
         commands.update({
@@ -242,43 +431,37 @@ class InteractiveConsole:
             '/models': 'Show available AI models'
         })
 
+        self._commands_cache = commands
+        self._sorted_commands = tuple(sorted(commands.items()))
         return commands
 
     def _show_command_suggestions(self, prefix="/"):
         """Show available commands that match the prefix."""
-        commands = self._get_available_commands()
-        matches = [(cmd, desc) for cmd, desc in commands.items() if cmd.startswith(prefix)]
+        self._get_available_commands()
+        matches = _prefix_slice(self._sorted_commands, prefix)
         
         if matches:
             console.print("\n[dim]Available commands:[/dim]")
-            for cmd, desc in sorted(matches)[:10]:  # Show max 10 suggestions
+            for cmd, desc in matches[:10]:  # Show max 10 suggestions
                 console.print(f"  [cyan]{cmd}[/cyan] - [dim]{desc}[/dim]")
             if len(matches) > 10:
                 console.print(f"  [dim]... and {len(matches) - 10} more[/dim]")
             console.print()  # Empty line for spacing
 
-    def _get_user_input_with_completion(self):
-        """Get user input with Rich formatting and readline completion."""
-        try:
-            import readline
-
-            # Set up autocomplete before prompting
-            commands = list(self._get_available_commands().keys())
-            def completer(text, state):
-                if text.startswith('/'):
-                    matches = [cmd for cmd in commands if cmd.startswith(text)]
-                    return matches[state] if state < len(matches) else None
-                return None
+    async def _get_user_input_with_completion(self):
+        """Get user input from prompt_toolkit's non-blocking prompt."""
+        return (await self._get_prompt_session().prompt_async()).strip()
 
-            readline.set_completer(completer)
-            readline.parse_and_bind("tab: complete")
+    def _get_prompt_session(self):
+        """Get the persistent prompt_toolkit session, creating it on first input."""
+        if self._prompt_session is None:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.completion import WordCompleter
+            from prompt_toolkit.formatted_text import HTML
 
-            # Use Rich prompt for proper formatting
-            return Prompt.ask("\n[bold blue]You[/bold blue]").strip()
-
-        except ImportError:
-            # Fallback to basic input if readline not available
-            return input("\nYou: ").strip()
+            completer = WordCompleter(lambda: list(self._get_available_commands()), sentence=True)
+            self._prompt_session = PromptSession(HTML(PROMPT_MESSAGE), completer=completer)
+        return self._prompt_session
 
     async def _handle_slash_command(self, command):
         """Handle slash command execution."""
@@ -305,10 +488,8 @@ class InteractiveConsole:
         elif command == '/exit':
             raise KeyboardInterrupt  # Exit the loop
         elif command.startswith('/list-apps') or command == '/list-apps':
-            from . import apps as apps_module
             apps_module.list_apps()
         elif command.startswith('/models') or command == '/models':
-            from .models import list_available_providers, list_available_models
             providers = list_available_providers()
             if providers:
                 console.print(f"Configured providers: {', '.join(providers)}")
@@ -336,7 +517,6 @@ class InteractiveConsole:
                 app_name, cmd_name = app_cmd.split('_', 1) if '_' in app_cmd else (app_cmd, '')
 
             # Find the app and execute
-            from . import apps as apps_module
             discovered = apps_module.discover()
             app_info = discovered.get(app_name)
 
@@ -354,60 +534,30 @@ class InteractiveConsole:
 
     def show_help(self):
         """Display help information."""
-        help_text = """
-[bold]Clanker Interactive Console[/bold]
-
-[cyan]Slash Commands:[/cyan]
-  /help        - Show this help message
-  /context     - Show conversation history
-  /tools       - List available tools
-  /exit        - Exit the console
-  /list-apps   - List all available apps
-  /models      - Show available AI models
-  /example:*   - Example app commands (add, list, search, etc.)
-
-[cyan]Examples:[/cyan]
-  "What are my recipes?"
-  "/list-apps"
-  "/example:add 'Today was great!'"
-"""
-        console.print(Panel(help_text, border_style="blue"))
+        console.print(_help_panel())
     
+    @functools.cached_property
     def _is_interactive(self) -> bool:
-        """Check if we're in an interactive environment."""
-        # Check if stdin is a tty (real terminal)
-        if not sys.stdin.isatty():
-            return False
-        
-        # Check if we can actually read from stdin
+        """Whether we're in an interactive environment (probed once)."""
+        # stdin must be a readable tty (real terminal). Nothing is read from
+        # it here: peeking could consume buffered input on some platforms
         try:
-            # Test if stdin is readable without blocking
-            import select
-            ready, _, _ = select.select([sys.stdin], [], [], 0)
-            # If stdin is immediately ready, it might be redirected/closed
-            if ready:
-                # Try to peek at stdin
-                try:
-                    sys.stdin.peek(1)  # This will fail if stdin is not buffered properly
-                except (OSError, AttributeError):
-                    return False
-        except (ImportError, OSError):
-            # select not available on all platforms, fall back to basic checks
-            pass
-        
-        # Additional check: see if we can create a prompt
+            if not (os.isatty(sys.stdin.fileno()) and sys.stdin.readable()):
+                return False
+        except (AttributeError, OSError, ValueError):
+            # stdin missing, closed, or not backed by a file descriptor
+            return False
+
+        # Don't actually prompt, just check if the console is compatible
         try:
-            # This is a more direct test - just check if rich.prompt would work
-            from rich.prompt import Prompt
-            # Don't actually prompt, just check if the console is compatible
             return console.is_terminal and not console.legacy_windows
-        except:
+        except Exception:
             return False
     
     async def run(self):
         """Main console loop."""
         # Check if we're in an interactive environment
-        if not self._is_interactive():
+        if not self._is_interactive:
             console.print("[red]Error: Interactive console requires a terminal with stdin[/red]")
             console.print("[dim]Hint: Use 'clanker \"your request\"' for one-shot commands[/dim]")
             return
@@ -431,6 +581,7 @@ class InteractiveConsole:
             # Fallback to simple welcome if config check fails
             welcome_text = "[bold cyan]Clanker Interactive Console[/bold cyan]\nType '/help' for commands"
 
+        from rich.panel import Panel
         console.print(Panel.fit(welcome_text, border_style="cyan"))
 
         # Show initial tips
@@ -440,8 +591,8 @@ class InteractiveConsole:
         # Main loop
         while True:
             try:
-                # Get user input with Rich formatting and readline completion
-                user_input = self._get_user_input_with_completion()
+                # Get user input (prompt_toolkit, with slash-command completion)
+                user_input = await self._get_user_input_with_completion()
 
                 # Handle empty input
                 if not user_input:
@@ -461,7 +612,7 @@ class InteractiveConsole:
                 response, tools_used = await self.handle_request(user_input)
                 
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 console.print("\n[yellow]Interrupted[/yellow]")
                 break
             except Exception as e:
@@ -1,16 +1,36 @@
 """Context management for core Clanker functionality."""
 
-from .builder import ContextBuilder
-from .store import ContextStore
-from .templates import app_scaffold_context, coding_session_context, build_all_contexts
-from .hints import get_smart_hints
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .builder import ContextBuilder
+    from .store import ContextStore
+    from .templates import app_scaffold_context, coding_session_context, build_all_contexts
+    from .hints import get_smart_hints
 
 __all__ = [
     "ContextBuilder",
     "ContextStore",
-    "app_scaffold_context", 
+    "app_scaffold_context",
     "coding_session_context",
     "build_all_contexts",
     "get_smart_hints",
 ]
 
+# Public name -> defining submodule, imported on first access
+_LAZY_EXPORTS = {
+    "ContextBuilder": ".builder",
+    "ContextStore": ".store",
+    "app_scaffold_context": ".templates",
+    "coding_session_context": ".templates",
+    "build_all_contexts": ".templates",
+    "get_smart_hints": ".hints",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
@@ -1,15 +1,31 @@
 """Simple context builder for composing markdown sections."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
+# Markdown snippets shipped with the package
+SNIPPETS_DIR = Path(__file__).parent / "snippets"
+
+
+@lru_cache(maxsize=64)
+def load_snippet(name: str, snippets_dir: Path = SNIPPETS_DIR) -> Optional[str]:
+    """Return a snippet's stripped contents, or None if it doesn't exist.
+
+    Each snippet is read once; snippets ship with the package and don't change.
+    """
+    try:
+        return (snippets_dir / f"{name}.md").read_bytes().decode("utf-8").strip()
+    except FileNotFoundError:
+        return None
+
 
 class ContextBuilder:
     """Simple builder for composing markdown context documents."""
     
     def __init__(self):
         self.sections: List[str] = []
-        self.snippets_dir = Path(__file__).parent / "snippets"
+        self.snippets_dir = SNIPPETS_DIR
     
     def add(self, content: str, title: Optional[str] = None) -> 'ContextBuilder':
         """Add content with optional title."""
@@ -21,12 +37,9 @@ class ContextBuilder:
     
     def add_snippet(self, name: str) -> 'ContextBuilder':
         """Add content from a snippet file."""
-        snippet_path = self.snippets_dir / f"{name}.md"
-        try:
-            content = snippet_path.read_text().strip()
+        content = load_snippet(name, self.snippets_dir)
+        if content is not None:  # Skip missing snippets silently
             self.sections.append(content)
-        except FileNotFoundError:
-            pass  # Skip missing snippets silently
         return self
     
     def build(self) -> str:
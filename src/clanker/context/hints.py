@@ -4,8 +4,8 @@ Provides brief, non-redundant context about apps - not tools.
 Pydantic-AI handles tool discovery automatically.
 """
 
-from ..tool_registry import get_registry
 from ..daemon import DaemonManager, DaemonStatus
+from ..runtime import get_runtime_context
 from ..logger import get_logger
 
 logger = get_logger("hints")
@@ -14,10 +14,10 @@ logger = get_logger("hints")
 def get_app_hints() -> str:
     """Generate simple app-level hints for LLM context."""
     try:
-        registry = get_registry()
-        # Only discover apps if not already loaded
-        if not registry.list_apps():
-            registry.discover_apps()
+        runtime = get_runtime_context()
+        # Discovery runs once per runtime context, not on every turn
+        runtime.ensure_registry_discovered()
+        registry = runtime.registry
 
         hints = []
         
@@ -28,16 +28,14 @@ def get_app_hints() -> str:
                 continue
 
             # Generic hint for all apps based on manifest
-            if manifest.summary and len(manifest.exports) > 0:
-                tool_count = len(manifest.exports)
+            tool_count = len(manifest.exports)
+            if manifest.summary and tool_count:
                 hints.append(f"{app_name}: {manifest.summary} ({tool_count} tools available).")
         
         # System-level context
-        has_daemon_tools = any('daemon' in t.lower() for t in registry.list_tools())
-        if has_daemon_tools:
+        if registry.has_daemon_tools():
             try:
-                from ..runtime import get_runtime_context
-                daemon_manager = DaemonManager(runtime=get_runtime_context())
+                daemon_manager = DaemonManager(runtime=runtime)
                 daemons = daemon_manager.list_daemons()
                 running_count = len([d for d in daemons if d['status'] == DaemonStatus.RUNNING])
                 if running_count > 0:
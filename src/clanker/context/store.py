@@ -1,12 +1,25 @@
 """Context storage and file management."""
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _find_project_root() -> Path:
+    """Find the project root by looking for pyproject.toml above this file."""
+    current = Path(__file__).resolve()
+    while current.parent != current:
+        if (current / "pyproject.toml").exists():
+            return current
+        current = current.parent
+    return Path.cwd()
+
+
 class ContextStore:
     """Manages context files for different CLI tools."""
     
@@ -16,46 +29,50 @@ class ContextStore:
         "cursor": "AGENTS.md", 
         "gemini": "GEMINI.md",
     }
+
+    # Master instructions file, also used for tools without their own file
+    DEFAULT_FILE = "INSTRUCTIONS.md"
     
     def __init__(self, project_root: Optional[Path] = None):
         if project_root is None:
-            # Find project root by looking for pyproject.toml
-            current = Path(__file__).resolve()
-            while current.parent != current:
-                if (current / "pyproject.toml").exists():
-                    project_root = current
-                    break
-                current = current.parent
-            else:
-                project_root = Path.cwd()
+            project_root = _find_project_root()  # Searched once per process
         
         self.project_root = Path(project_root)
+        # Target paths are fixed per store, so join them once
+        self._instructions_path = self.project_root / self.DEFAULT_FILE
+        self._tool_paths: Dict[str, Path] = {
+            tool: self.project_root / filename for tool, filename in self.TOOL_FILES.items()
+        }
     
     def write_all(self, content: str) -> Dict[str, bool]:
         """Write context to all tool files."""
         results = {}
+        data = content.encode("utf-8")  # Encoded once, written to every file
         
         # Always write INSTRUCTIONS.md as master file
-        instructions_path = self.project_root / "INSTRUCTIONS.md"
-        results["INSTRUCTIONS.md"] = self._write_file(instructions_path, content)
+        results[self.DEFAULT_FILE] = self._write_file(self._instructions_path, data)
         
         # Write tool-specific files
-        for tool_name, filename in self.TOOL_FILES.items():
-            file_path = self.project_root / filename
-            results[filename] = self._write_file(file_path, content)
+        for file_path in self._tool_paths.values():
+            results[file_path.name] = self._write_file(file_path, data)
         
         return results
     
     def write_for_tool(self, tool: str, content: str) -> bool:
         """Write context for a specific tool."""
-        filename = self.TOOL_FILES.get(tool, "INSTRUCTIONS.md")
-        file_path = self.project_root / filename
-        return self._write_file(file_path, content)
+        file_path = self._tool_paths.get(tool, self._instructions_path)
+        return self._write_file(file_path, content.encode("utf-8"))
     
-    def _write_file(self, path: Path, content: str) -> bool:
-        """Write content to file, return success status."""
+    def _write_file(self, path: Path, data: bytes) -> bool:
+        """Write encoded content to file, return success status."""
         try:
-            path.write_text(content)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                view = memoryview(data)
+                while view:  # os.write may write less than asked
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             return True
         except Exception as e:
             logger.error(f"Failed to write context file {path}: {e}", exc_info=True)
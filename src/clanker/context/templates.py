@@ -1,16 +1,73 @@
 """High-level context templates for common scenarios."""
 
 import logging
-from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
-from .builder import ContextBuilder
+from .builder import ContextBuilder, load_snippet
 from .store import ContextStore
 from .hints import get_smart_hints
 from ..apps import discover as discover_apps
 
 logger = logging.getLogger(__name__)
 
+# Templates formatted per call; literal braces are doubled
+_SESSION_HEADER_TEMPLATE = """# Clanker {tool_display} Session
+
+This {tool_display} session was launched from Clanker. You have full context about the Clanker system 
+and should help with development tasks within this environment.
+
+---"""
+
+_IMPLEMENTATION_TEMPLATE = """## Implementation Steps
+
+### 1. Set up basic structure
+```bash
+mkdir apps/{app_name}
+cd apps/{app_name}
+uv init
+uv add clanker typer pydantic
+```
+
+### 2. Create main.py with typer commands
+```python
+import typer
+
+app = typer.Typer()
+
+@app.command()
+def hello(name: str = "world"):
+    \"\"\"Say hello.\"\"\"
+    print(f"Hello {{name}}!")
+
+if __name__ == "__main__":
+    app()
+```
+
+### 3. Add CLI exports to pyproject.toml
+```toml
+[tool.clanker.exports]
+hello = "python main.py hello {{name}}"
+```
+
+### 4. Test your app
+- Test locally: `uv run python main.py hello`
+- Test via Clanker: `clanker {app_name}_hello name="test"`"""
+
+# Closing section of the apps context
+_APPS_DEVELOPMENT_TAIL = (
+    "## Development",
+    "Create new apps in `apps/` directory with:",
+    "- `main.py` with typer CLI",
+    "- `pyproject.toml` with dependencies and exports",
+    "- Isolated storage via Clanker storage system",
+)
+
+
+def _snippets(*names: str) -> List[str]:
+    """Return the contents of the named snippets that exist, in order."""
+    contents = (load_snippet(name) for name in names)
+    return [content for content in contents if content is not None]
+
 
 
 
@@ -28,39 +85,34 @@ def coding_session_context(tool_name: str, user_request: str) -> str:
         Complete context document for the coding session
     """
     sections = []
-    snippets_dir = Path(__file__).parent / "snippets"
     
     # Add session header
     tool_display = tool_name.title() if tool_name else "Coding"
-    session_header = f"""# Clanker {tool_display} Session
-
-This {tool_display} session was launched from Clanker. You have full context about the Clanker system 
-and should help with development tasks within this environment.
-
----"""
+    session_header = _SESSION_HEADER_TEMPLATE.format(tool_display=tool_display)
     sections.append(session_header)
     
-    # Load and add INSTRUCTIONS.md content
+    # Load and add INSTRUCTIONS.md content (a single open; missing is fine)
+    instructions_loaded = False
     try:
-        project_root = Path(__file__).resolve().parent.parent.parent
-        instructions_path = project_root / "INSTRUCTIONS.md"
-        if instructions_path.exists():
-            instructions = instructions_path.read_text()
+        store = ContextStore()
+        with open(store.project_root / store.DEFAULT_FILE, encoding="utf-8") as f:
+            first_line = f.readline()
             # Remove the first # header since we have our own
-            if instructions.startswith("# "):
-                instructions = instructions[instructions.find("\n") + 1:]
-            sections.append(instructions.strip())
+            instructions = f.read() if first_line.startswith("# ") else first_line + f.read()
+        sections.append(instructions.strip())
+        instructions_loaded = True
+    except FileNotFoundError:
+        pass
     except Exception as e:
         logger.debug(f"Failed to load INSTRUCTIONS.md for coding session: {e}")
     
     # Add a separator before dynamic content
     sections.append("---\n## Current System State")
     
-    # Add the same base context as the agent
-    try:
-        sections.append((snippets_dir / "clanker_overview.md").read_text())
-    except FileNotFoundError:
-        pass
+    # Add the same base context as the agent. INSTRUCTIONS.md is built from
+    # these snippets, so they are only needed when it wasn't loaded
+    if not instructions_loaded:
+        sections.extend(_snippets("clanker_overview"))
     
     # Add smart contextual hints
     hints = get_smart_hints()
@@ -68,11 +120,8 @@ and should help with development tasks within this environment.
         sections.append(f"## Contextual Hints\n\n{hints}")
     
     # Add CLI patterns and export system
-    for snippet in ["cli_patterns", "export_system"]:
-        try:
-            sections.append((snippets_dir / f"{snippet}.md").read_text())
-        except FileNotFoundError:
-            pass
+    if not instructions_loaded:
+        sections.extend(_snippets("cli_patterns", "export_system"))
     
     # Add user request
     if user_request:
@@ -92,60 +141,19 @@ def app_scaffold_context(app_name: str, description: str) -> str:
         Complete scaffold guide as markdown
     """
     sections = []
-    snippets_dir = Path(__file__).parent / "snippets"
     
     # Add header
     sections.append(f"# {app_name.title()} App\n\n## Overview\n{description}")
     
     # Add structure guide
-    try:
-        sections.append((snippets_dir / "app_structure.md").read_text())
-    except FileNotFoundError:
-        pass
+    sections.extend(_snippets("app_structure"))
     
     # Add implementation steps
-    implementation = f"""## Implementation Steps
-
-### 1. Set up basic structure
-```bash
-mkdir apps/{app_name}
-cd apps/{app_name}
-uv init
-uv add clanker typer pydantic
-```
-
-### 2. Create main.py with typer commands
-```python
-import typer
-
-app = typer.Typer()
-
-@app.command()
-def hello(name: str = "world"):
-    \"\"\"Say hello.\"\"\"
-    print(f"Hello {{name}}!")
-
-if __name__ == "__main__":
-    app()
-```
-
-### 3. Add CLI exports to pyproject.toml
-```toml
-[tool.clanker.exports]
-hello = "python main.py hello {{name}}"
-```
-
-### 4. Test your app
-- Test locally: `uv run python main.py hello`
-- Test via Clanker: `clanker {app_name}_hello name="test"`"""
+    implementation = _IMPLEMENTATION_TEMPLATE.format(app_name=app_name)
     sections.append(implementation)
     
     # Add storage guide, export system details, and CLI patterns
-    for snippet in ["storage_guide", "export_system", "cli_patterns"]:
-        try:
-            sections.append((snippets_dir / f"{snippet}.md").read_text())
-        except FileNotFoundError:
-            pass
+    sections.extend(_snippets("storage_guide", "export_system", "cli_patterns"))
     
     return "\n\n".join(sections).strip()
 
@@ -204,17 +212,10 @@ def get_available_apps_context() -> str:
         lines.append(f"- **Location**: `apps/{app_name}/`")
         lines.append(f"- **Description**: {description}")
         if exports:
+            command_prefix = f"`clanker {app_name}_"
             lines.append(f"- **CLI Exports**: {', '.join(exports)}")
-            commands = [f"`clanker {app_name}_{export}`" for export in exports]
-            lines.append(f"- **Commands**: {', '.join(commands)}")
+            lines.append(f"- **Commands**: {', '.join(command_prefix + export + '`' for export in exports)}")
         lines.append("")
 
-    lines.append("## Development")
-    lines.append("Create new apps in `apps/` directory with:")
-    lines.append("- `main.py` with typer CLI")
-    lines.append("- `pyproject.toml` with dependencies and exports")
-    lines.append("- Isolated storage via Clanker storage system")
-
+    lines.extend(_APPS_DEVELOPMENT_TAIL)
     return "\n".join(lines)
-
-
@@ -5,9 +5,6 @@ import shutil
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
 
 from .models import _get_available_providers
 from .logger import get_logger
@@ -68,6 +65,9 @@ def needs_onboarding() -> bool:
 
 def show_setup_guidance() -> None:
     """Display comprehensive setup guidance."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     console.print()
 
     # Welcome header
@@ -180,6 +180,8 @@ def offer_env_creation() -> bool:
     if not env_example_path.exists():
         return False
 
+    from rich.prompt import Confirm
+
     console.print()
     if Confirm.ask("Would you like me to create a .env file from the template?", default=True):
         try:
@@ -17,7 +17,7 @@ from .storage.schema import DatabaseSchema, ensure_database_initialized
 from .tool_registry import ToolRegistry, get_registry
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class RuntimeContext:
     """Aggregates shared runtime services for Clanker components."""
 
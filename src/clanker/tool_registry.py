@@ -62,13 +62,16 @@ class AppManifest:
     def from_pyproject(cls, app_path: Path) -> Optional["AppManifest"]:
         """Load app manifest from pyproject.toml."""
         pyproject_path = app_path / "pyproject.toml"
-        if not pyproject_path.exists():
-            return None
-
         try:
             with open(pyproject_path, "rb") as f:
                 data = tomllib.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load manifest from {app_path}: {e}")
+            return None
 
+        try:
             clanker_config = data.get("tool", {}).get("clanker", {})
             if not clanker_config:
                 return None
@@ -124,12 +127,14 @@ class ToolRegistry:
         self._tools: Dict[str, Callable] = {}
         self._metadata: Dict[str, ToolMetadata] = {}
         self._app_manifests: Dict[str, AppManifest] = {}
+        self._daemon_tools_present: Optional[bool] = None  # Cached by has_daemon_tools()
 
     def register(self, func: Callable, metadata: ToolMetadata) -> None:
         """Register a tool with its metadata."""
         tool_name = func.__name__
         self._tools[tool_name] = func
         self._metadata[tool_name] = metadata
+        self._daemon_tools_present = None
         logger.debug(f"Registered tool: {tool_name}")
 
     def get_tool(self, name: str) -> Optional[Callable]:
@@ -151,6 +156,12 @@ class ToolRegistry:
             tools.append(name)
         return sorted(tools)
 
+    def has_daemon_tools(self) -> bool:
+        """Whether any visible tool is daemon-related (cached until the next register)."""
+        if self._daemon_tools_present is None:
+            self._daemon_tools_present = any('daemon' in t.lower() for t in self.list_tools())
+        return self._daemon_tools_present
+
     def get_display_info(self, name: str) -> Dict[str, str]:
         """Get display information for a tool."""
         metadata = self._metadata.get(name)
@@ -171,10 +182,13 @@ class ToolRegistry:
         if not apps_dir.exists():
             return
 
-        for app_path in apps_dir.iterdir():
-            if not app_path.is_dir() or app_path.name.startswith(("_", ".")):
-                continue
+        with os.scandir(apps_dir) as entries:
+            app_paths = [
+                Path(entry.path) for entry in entries
+                if not entry.name.startswith(("_", ".")) and entry.is_dir()
+            ]
 
+        for app_path in app_paths:
             manifest = AppManifest.from_pyproject(app_path)
             if manifest and manifest.exports:
                 self._app_manifests[manifest.name] = manifest
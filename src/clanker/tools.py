@@ -5,8 +5,7 @@ import subprocess
 import sys
 import shlex
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from pydantic_ai.toolsets import FunctionToolset
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 from .logger import get_logger
 from .daemon import DaemonManager, DaemonStatus
@@ -14,6 +13,9 @@ from .profile import Profile
 from .storage.db import DB
 from .tool_registry import get_registry, tool
 
+if TYPE_CHECKING:
+    from pydantic_ai.toolsets import FunctionToolset
+
 logger = get_logger("tools")
 
 
@@ -647,7 +649,7 @@ def discover_cli_exports() -> Dict[str, Dict[str, str]]:
 
 
 
-def create_clanker_toolset(runtime=None) -> FunctionToolset:
+def create_clanker_toolset(runtime=None) -> "FunctionToolset":
     """
     Create the main clanker toolset with all CLI export tools and core tools.
 
@@ -691,6 +693,7 @@ def create_clanker_toolset(runtime=None) -> FunctionToolset:
         runtime_ctx.mark_core_tools_registered()
     
     # Create pydantic toolset from registry
+    from pydantic_ai.toolsets import FunctionToolset
     toolset = FunctionToolset()
     for tool_name in registry.list_tools():
         tool_func = registry.get_tool(tool_name)
@@ -0,0 +1,55 @@
+"""Regression tests for ClankerAgent.handle_request_stream_async."""
+
+import asyncio
+
+from pydantic_ai import Agent
+from pydantic_ai.messages import TextPart, ToolReturnPart
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from clanker.agent import ClankerAgent
+
+
+async def _preamble_then_tool_call(messages, info):
+    """Write preamble text and call a tool, then answer once it returns."""
+    if isinstance(messages[-1].parts[-1], ToolReturnPart):
+        yield "Done, found "
+        yield "3 apps."
+    else:
+        yield "Let me check your apps. "
+        yield {0: DeltaToolCall(name="list_apps", json_args="{}")}
+
+
+def _make_agent() -> ClankerAgent:
+    """Build a ClankerAgent around a FunctionModel, skipping runtime setup."""
+    agent = Agent(FunctionModel(stream_function=_preamble_then_tool_call))
+
+    @agent.tool_plain
+    def list_apps() -> str:
+        return "recipes, notes, weather"
+
+    clanker_agent = ClankerAgent.__new__(ClankerAgent)
+    clanker_agent.agent = agent
+    clanker_agent.message_history = []
+    return clanker_agent
+
+
+async def _collect(clanker_agent: ClankerAgent, request: str) -> list:
+    return [chunk async for chunk in clanker_agent.handle_request_stream_async(request)]
+
+
+def test_stream_continues_past_preamble_and_tool_call():
+    clanker_agent = _make_agent()
+
+    chunks = asyncio.run(_collect(clanker_agent, "what apps do I have?"))
+
+    assert chunks == [
+        ("text", "Let me check your apps. "),
+        ("tool_call", {"name": "list_apps", "args": "{}"}),
+        ("tool_output", "recipes, notes, weather"),
+        ("text", "Done, found "),
+        ("text", "3 apps."),
+    ]
+    # History ends on the final answer, not the tool return
+    last_part = clanker_agent.message_history[-1].parts[-1]
+    assert isinstance(last_part, TextPart)
+    assert last_part.content == "Done, found 3 apps."
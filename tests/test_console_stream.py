@@ -0,0 +1,30 @@
+"""Tests for InteractiveConsole's streamed request handling."""
+
+import asyncio
+
+from clanker.console import InteractiveConsole
+
+
+class _StreamingAgent:
+    """Stands in for ClankerAgent, replaying a preamble, a tool call and an answer."""
+
+    async def handle_request_stream_async(self, request):
+        yield "text", "Let me check."
+        yield "tool_call", {"name": "list_apps", "args": {}}
+        yield "tool_output", "recipes\nnotes\n"
+        yield "text", "Done, "
+        yield "text", "found 2 apps."
+
+
+def test_streamed_turns_and_tool_output_are_recorded():
+    interactive = InteractiveConsole(stream=True)
+    interactive._agent = _StreamingAgent()
+
+    response, tool_calls = asyncio.run(interactive.handle_request("what apps?"))
+
+    assert response == "Let me check.\n\nDone, found 2 apps."
+    assert tool_calls == [{"name": "list_apps", "args": {}}]
+    exchange = interactive.history[-1]
+    assert exchange.assistant == response
+    assert exchange.tool_output == "recipes\nnotes"
+    assert exchange.tool_output_first_line == "recipes"